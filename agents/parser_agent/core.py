@@ -6,6 +6,12 @@ Parser Agent - Specialized agent for parsing API specifications and generating c
 import os
 import json
 import yaml
+import aiofiles
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 import asyncio
 from typing import Dict, List, Any, Optional, Union
 from pathlib import Path
@@ -17,6 +23,150 @@ from common.config import get_config
 from common.logger import get_agent_logger
 
 
+
+# Static prompt bodies with run-specific values appended at the tail.
+# Provider-side prompt caches hit on exact prefixes only, so keeping the
+# dynamic tokens last lets repeated calls reuse the cached static prefix.
+_ENHANCEMENT_PROMPT_STATIC = """
+        Analyze the parsed API specification and enhance it for comprehensive test generation.
+
+        For each endpoint, suggest:
+        1. Additional test scenarios (edge cases, boundary values)
+        2. Realistic test data generation strategies
+        3. Data dependencies between endpoints
+        4. Performance test considerations
+        5. Security test scenarios
+
+        Focus on creating parameterized tests and avoiding hardcoded values.
+        Ensure all authentication and sensitive data uses environment variables.
+
+        Respond with JSON:
+        {
+            "test_data_strategies": {"endpoint_path": "strategy_description"},
+            "test_dependencies": [
+                {"prerequisite": "endpoint1", "dependent": "endpoint2", "reason": "needs_id"}
+            ],
+            "global_test_config": {
+                "base_url_param": "api.base.url",
+                "auth_config": "parameterized authentication configuration",
+                "environment_vars": ["API_KEY", "BASE_URL", "AUTH_TOKEN"],
+                "security_recommendations": ["Use environment variables", "Rotate API keys regularly"]
+            },
+            "enhanced_scenarios": {
+                "endpoint_path": [
+                    {"name": "scenario_name", "type": "positive|negative", "description": "what it tests"}
+                ]
+            }
+        }
+"""
+
+_CONFIG_PROMPT_STATIC = """
+        Generate environment-specific configuration files for API testing with user-provided settings.
+
+        Create configuration files for each environment with:
+        - Parameterized base URLs (no hardcoding)
+        - Environment-specific settings
+        - Authentication configuration for the specified authentication type
+        - Timeout and retry settings
+        - Logging configuration
+        - Security variables from replaced secrets
+
+        Respond with JSON:
+        {
+            "config_files": {
+                "environment_name.properties": "file content here"
+            },
+            "env_template": ".env template content",
+            "security_setup_guide": "Instructions for setting up replaced secrets"
+        }
+"""
+
+_TEST_DATA_PROMPT_STATIC = """
+        Generate realistic test data for API testing based on the data models.
+
+        Create test data files with:
+        - Valid data sets for positive tests
+        - Invalid data sets for negative tests  
+        - Boundary value test cases
+        - Realistic data that follows business logic
+        - Parameterized data sets (no hardcoded IDs)
+
+        Use environment variables for sensitive data.
+
+        Respond with JSON:
+        {
+            "test_data_files": {
+                "filename.json": "file content here"
+            }
+        }
+"""
+
+_BUNDLE_PROMPT_STATIC = """
+        Generate environment configuration files AND realistic test data for API testing
+        in a single response.
+
+        Configuration files must have:
+        - Parameterized base URLs (no hardcoding)
+        - Environment-specific settings
+        - Authentication configuration for the specified authentication type
+        - Timeout and retry settings
+        - Logging configuration
+        - Security variables from replaced secrets
+
+        Test data files must have:
+        - Valid data sets for positive tests
+        - Invalid data sets for negative tests
+        - Boundary value test cases
+        - Realistic data that follows business logic
+        - Parameterized data sets (no hardcoded IDs)
+
+        Respond with JSON:
+        {
+            "environment_configs": {
+                "config_files": {
+                    "environment_name.properties": "file content here"
+                },
+                "env_template": ".env template content",
+                "security_setup_guide": "Instructions for setting up replaced secrets"
+            },
+            "test_data": {
+                "test_data_files": {
+                    "filename.json": "file content here"
+                }
+            }
+        }
+"""
+
+
+# Deterministic config skeletons: when the user supplies every environment
+# URL there is nothing left for the LLM to decide, so these render locally
+_STATIC_PROPERTIES_TMPL = """# {environment} environment configuration
+api.base.url={base_url}
+api.auth.type={auth_type}
+api.timeout.connection=10000
+api.timeout.read=30000
+api.retry.count=3
+logging.level=INFO
+"""
+
+_STATIC_ENV_TEMPLATE = """# Environment variables for API testing
+# Copy to .env and fill in the values - never commit the filled file
+API_BASE_URL=
+API_AUTH_TOKEN=
+API_USERNAME=
+API_PASSWORD=
+"""
+
+
+# System messages reused verbatim on every call; identical strings let the
+# provider reuse its prompt cache across agents and operations
+_SYS_ENHANCEMENT = "You are an expert in API testing, security, and test automation best practices."
+_SYS_CONFIG = "Create production-ready configuration files with proper parameterization and security."
+_SYS_TEST_DATA = "Generate realistic, production-ready test data with proper parameterization."
+_SYS_BUNDLE = ("Create production-ready configuration files and realistic test data "
+               "with proper parameterization and security.")
+
+
 class ParserAgent:
     """Agent responsible for parsing API specifications and generating test data"""
 
@@ -25,6 +175,25 @@ class ParserAgent:
         self.logger = get_agent_logger("parser_agent")
         self.ai_connector = AIConnectorFactory.create_connector()
 
+        # Built once; execute_operation dispatches thousands of times per
+        # workflow and should not re-allocate the mapping on each call
+        self._operation_mapping = {
+            "parse_api_specification": self.parse_api_specification,
+            "generate_environment_configs": self.generate_environment_configs,
+            "generate_test_data": self.generate_test_data,
+
+            # Alternative operation names
+            "parse_swagger": self.parse_api_specification,
+            "parse_postman": self.parse_api_specification,
+            "parse_yaml": self.parse_api_specification,
+            "create_test_config": self.generate_environment_configs,
+            "create_test_data": self.generate_test_data,
+            "generate_test_configuration": self.generate_environment_configs,
+
+            # Bundled operation: one LLM round-trip for configs + test data
+            "generate_project_artifacts": self.generate_project_artifacts
+        }
+
         self.logger.info("Parser Agent initialized")
 
     async def parse_api_specification(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -79,13 +248,18 @@ class ParserAgent:
     def _read_specification_file(self, file_path: str) -> Union[Dict, str]:
         """Read and parse specification file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                if file_path.endswith('.json'):
+            if file_path.endswith('.json'):
+                # orjson parses large OpenAPI/Postman documents several times
+                # faster than stdlib json; it needs bytes, so read binary
+                if orjson is not None:
+                    with open(file_path, 'rb') as f:
+                        return orjson.loads(f.read())
+                with open(file_path, 'r', encoding='utf-8') as f:
                     return json.load(f)
-                elif file_path.endswith(('.yml', '.yaml')):
+            with open(file_path, 'r', encoding='utf-8') as f:
+                if file_path.endswith(('.yml', '.yaml')):
                     return yaml.safe_load(f)
-                else:
-                    return f.read()
+                return f.read()
         except Exception as e:
             raise ValueError(f"Failed to read specification file: {str(e)}")
 
@@ -542,6 +716,20 @@ class ParserAgent:
 
         return replace_in_object(content)
 
+    async def _write_files(self, items: List[tuple]) -> List[str]:
+        """Write (path, content) pairs concurrently via aiofiles.
+
+        Synchronous write_text blocks the event loop and stalls every other
+        agent's in-flight LLM call while the files land on disk.
+        """
+        async def _write_one(path: Path, content: str):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            async with aiofiles.open(path, 'w', encoding='utf-8') as f:
+                await f.write(content)
+
+        await asyncio.gather(*(_write_one(path, content) for path, content in items))
+        return [str(path) for path, _ in items]
+
     async def _enhance_with_ai_analysis(self, parsed_data: Dict[str, Any], language: str) -> Dict[str, Any]:
         """Enhance parsed data with AI analysis and security scanning"""
 
@@ -554,49 +742,17 @@ class ParserAgent:
             parsed_data = self._replace_hardcoded_secrets(parsed_data, security_warnings)
             parsed_data['security_warnings'] = security_warnings
 
-        enhancement_prompt = f"""
-        Analyze the parsed API specification and enhance it for comprehensive test generation:
-
+        enhancement_prompt = _ENHANCEMENT_PROMPT_STATIC + f"""
         API Information:
         - Title: {parsed_data.get('title', 'Unknown')}
         - Endpoints: {len(parsed_data.get('endpoints', []))}
         - Language: {language}
         - Security Issues: {len(security_warnings)} hardcoded secrets detected and replaced
-
-        For each endpoint, suggest:
-        1. Additional test scenarios (edge cases, boundary values)
-        2. Realistic test data generation strategies
-        3. Data dependencies between endpoints
-        4. Performance test considerations
-        5. Security test scenarios
-
-        Focus on creating parameterized tests and avoiding hardcoded values.
-        Ensure all authentication and sensitive data uses environment variables.
-
-        Respond with JSON:
-        {{
-            "test_data_strategies": {{"endpoint_path": "strategy_description"}},
-            "test_dependencies": [
-                {{"prerequisite": "endpoint1", "dependent": "endpoint2", "reason": "needs_id"}}
-            ],
-            "global_test_config": {{
-                "base_url_param": "api.base.url",
-                "auth_config": "parameterized authentication configuration",
-                "environment_vars": ["API_KEY", "BASE_URL", "AUTH_TOKEN"],
-                "security_recommendations": ["Use environment variables", "Rotate API keys regularly"]
-            }},
-            "enhanced_scenarios": {{
-                "endpoint_path": [
-                    {{"name": "scenario_name", "type": "positive|negative", "description": "what it tests"}}
-                ]
-            }}
-        }}
         """
 
         try:
             enhancement = await self.ai_connector.generate_structured_response(
-                enhancement_prompt,
-                "You are an expert in API testing, security, and test automation best practices."
+                enhancement_prompt, _SYS_ENHANCEMENT
             )
 
             # Merge enhancements with parsed data
@@ -636,9 +792,23 @@ class ParserAgent:
         environment_urls = project_config.get('environment_urls', {})
         security_warnings = parsed_data.get('security_warnings', [])
 
-        config_prompt = f"""
-        Generate environment-specific configuration files for API testing with user-provided settings:
+        # Fully specified configurations are deterministic boilerplate; render
+        # them locally and skip the LLM round-trip entirely
+        if environments and not security_warnings and \
+                all(env in environment_urls for env in environments):
+            to_write = self._render_static_configs(
+                output_path, language, environments, environment_urls, auth_type)
+            created_files = await self._write_files(to_write)
+
+            return {
+                "operation": "generate_environment_configs",
+                "status": "completed",
+                "created_files": created_files,
+                "security_warnings": security_warnings,
+                "message": f"Generated {len(created_files)} configuration files from static templates"
+            }
 
+        config_prompt = _CONFIG_PROMPT_STATIC + f"""
         Project: {project_name}
         Language: {language}
         Base URL: {base_url}
@@ -646,73 +816,20 @@ class ParserAgent:
         Environments: {environments}
         Security Issues: {len(security_warnings)} secrets replaced with parameters
 
-        Create configuration files for each environment with:
-        - Parameterized base URLs (no hardcoding)
-        - Environment-specific settings
-        - Authentication configuration for {auth_type}
-        - Timeout and retry settings
-        - Logging configuration
-        - Security variables from replaced secrets
-
         Environment URLs:
         {environment_urls}
 
         Include all security variables that were replaced:
         {[s['replacement'] for s in security_warnings]}
-
-        Respond with JSON:
-        {{
-            "config_files": {{
-                "environment_name.properties": "file content here"
-            }},
-            "env_template": ".env template content",
-            "security_setup_guide": "Instructions for setting up replaced secrets"
-        }}
         """
 
         try:
             response = await self.ai_connector.generate_structured_response(
-                config_prompt,
-                "Create production-ready configuration files with proper parameterization and security."
+                config_prompt, _SYS_CONFIG
             )
 
-            created_files = []
-
-            if language == "java":
-                config_dir = output_path / "src/test/resources"
-            else:
-                config_dir = output_path / "config"
-
-            config_dir.mkdir(parents=True, exist_ok=True)
-
-            # Create environment-specific config files
-            if "config_files" in response:
-                for filename, content in response["config_files"].items():
-                    config_file = config_dir / filename
-                    config_file.write_text(content, encoding='utf-8')
-                    created_files.append(str(config_file))
-
-            # Create .env template
-            if "env_template" in response:
-                env_file = output_path / ".env.template"
-                env_file.write_text(response["env_template"], encoding='utf-8')
-                created_files.append(str(env_file))
-
-            # Create security setup guide
-            if "security_setup_guide" in response and security_warnings:
-                security_file = output_path / "SECURITY_SETUP.md"
-                security_content = response["security_setup_guide"]
-
-                # Add detected secrets info
-                security_content += "\n\n## Detected Hardcoded Secrets\n\n"
-                security_content += "The following hardcoded secrets were detected and replaced:\n\n"
-
-                for warning in security_warnings:
-                    security_content += f"- **{warning['type']}** in `{warning['path']}`: "
-                    security_content += f"`{warning['original'][:20]}...` → `{warning['replacement']}`\n"
-
-                security_file.write_text(security_content, encoding='utf-8')
-                created_files.append(str(security_file))
+            to_write = self._collect_config_writes(response, output_path, language, security_warnings)
+            created_files = await self._write_files(to_write)
 
             return {
                 "operation": "generate_environment_configs",
@@ -739,59 +856,168 @@ class ParserAgent:
         models = parsed_data.get('models', {})
         endpoints = parsed_data.get('endpoints', [])
 
-        test_data_prompt = f"""
-        Generate realistic test data for API testing based on the data models:
-
+        test_data_prompt = _TEST_DATA_PROMPT_STATIC + f"""
         Models: {list(models.keys()) if models else 'None defined'}
         Endpoints: {len(endpoints)}
+        """
 
-        Create test data files with:
-        - Valid data sets for positive tests
-        - Invalid data sets for negative tests  
-        - Boundary value test cases
-        - Realistic data that follows business logic
-        - Parameterized data sets (no hardcoded IDs)
+        try:
+            response = await self.ai_connector.generate_structured_response(
+                test_data_prompt, _SYS_TEST_DATA
+            )
 
-        Use environment variables for sensitive data.
+            to_write = self._collect_test_data_writes(response, output_path, language)
+            created_files = await self._write_files(to_write)
 
-        Respond with JSON:
-        {{
-            "test_data_files": {{
-                "filename.json": "file content here"
-            }}
-        }}
+            return {
+                "operation": "generate_test_data",
+                "status": "completed",
+                "created_files": created_files,
+                "message": f"Generated {len(created_files)} test data files"
+            }
+
+        except Exception as e:
+            self.logger.error(f"Failed to generate test data: {str(e)}")
+            raise
+
+    def _render_static_configs(self, output_path: Path, language: str,
+                               environments: List[str], environment_urls: Dict[str, str],
+                               auth_type: str) -> List[tuple]:
+        """Render environment configs locally when fully specified by the user"""
+
+        if language == "java":
+            config_dir = output_path / "src/test/resources"
+        else:
+            config_dir = output_path / "config"
+
+        to_write = [
+            (config_dir / f"{environment}.properties",
+             _STATIC_PROPERTIES_TMPL.format(
+                 environment=environment,
+                 base_url=environment_urls[environment],
+                 auth_type=auth_type))
+            for environment in environments
+        ]
+        to_write.append((output_path / ".env.template", _STATIC_ENV_TEMPLATE))
+        return to_write
+
+    def _collect_config_writes(self, response: Dict[str, Any], output_path: Path,
+                               language: str, security_warnings: List[Dict[str, str]]) -> List[tuple]:
+        """Collect (path, content) pairs for an environment-config response"""
+
+        if language == "java":
+            config_dir = output_path / "src/test/resources"
+        else:
+            config_dir = output_path / "config"
+
+        to_write = []
+
+        # Create environment-specific config files; filenames come from the
+        # LLM, so strip any directory components in one normalization pass
+        if "config_files" in response:
+            to_write.extend(
+                (config_dir / Path(filename).name, content)
+                for filename, content in response["config_files"].items())
+
+        # Create .env template
+        if "env_template" in response:
+            to_write.append((output_path / ".env.template", response["env_template"]))
+
+        # Create security setup guide
+        if "security_setup_guide" in response and security_warnings:
+            security_content = response["security_setup_guide"]
+
+            # Add detected secrets info
+            security_content += "\n\n## Detected Hardcoded Secrets\n\n"
+            security_content += "The following hardcoded secrets were detected and replaced:\n\n"
+
+            for warning in security_warnings:
+                security_content += f"- **{warning['type']}** in `{warning['path']}`: "
+                security_content += f"`{warning['original'][:20]}...` → `{warning['replacement']}`\n"
+
+            to_write.append((output_path / "SECURITY_SETUP.md", security_content))
+
+        return to_write
+
+    def _collect_test_data_writes(self, response: Dict[str, Any], output_path: Path,
+                                  language: str) -> List[tuple]:
+        """Collect (path, content) pairs for a test-data response"""
+
+        if "test_data_files" not in response:
+            return []
+
+        if language == "java":
+            data_dir = output_path / "src/test/resources/testdata"
+        else:
+            data_dir = output_path / "testdata"
+
+        # Filenames come from the LLM; keep only the basename
+        return [(data_dir / Path(filename).name, content)
+                for filename, content in response["test_data_files"].items()]
+
+    async def generate_project_artifacts(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate environment configs and test data in one LLM round-trip.
+
+        Each structured call pays full prompt tokens plus time-to-first-token,
+        so asking for both sections in a single response halves the LLM cost
+        of project setup; the file writes fan out afterwards.
+        """
+
+        parsed_data = params.get('parsed_data', {})
+        project_name = params['project_name']
+        language = params['language']
+        output_path = Path(params['output_path'])
+        project_config = params.get('project_config', {})
+
+        self.logger.info(f"Generating bundled project artifacts for: {project_name}")
+
+        base_url = project_config.get('base_url') or parsed_data.get('base_url', '${api.base.url}')
+        auth_type = project_config.get('auth_type', 'none')
+        environments = project_config.get('environments', ['dev', 'staging', 'prod'])
+        environment_urls = project_config.get('environment_urls', {})
+        security_warnings = parsed_data.get('security_warnings', [])
+        models = parsed_data.get('models', {})
+        endpoints = parsed_data.get('endpoints', [])
+
+        bundle_prompt = _BUNDLE_PROMPT_STATIC + f"""
+        Project: {project_name}
+        Language: {language}
+        Base URL: {base_url}
+        Authentication: {auth_type}
+        Environments: {environments}
+        Security Issues: {len(security_warnings)} secrets replaced with parameters
+        Models: {list(models.keys()) if models else 'None defined'}
+        Endpoints: {len(endpoints)}
+
+        Environment URLs:
+        {environment_urls}
+
+        Include all security variables that were replaced:
+        {[s['replacement'] for s in security_warnings]}
         """
 
         try:
             response = await self.ai_connector.generate_structured_response(
-                test_data_prompt,
-                "Generate realistic, production-ready test data with proper parameterization."
+                bundle_prompt, _SYS_BUNDLE
             )
 
-            created_files = []
+            to_write = self._collect_config_writes(
+                response.get("environment_configs", {}), output_path, language, security_warnings)
+            to_write += self._collect_test_data_writes(
+                response.get("test_data", {}), output_path, language)
 
-            if "test_data_files" in response:
-                if language == "java":
-                    data_dir = output_path / "src/test/resources/testdata"
-                else:
-                    data_dir = output_path / "testdata"
-
-                data_dir.mkdir(parents=True, exist_ok=True)
-
-                for filename, content in response["test_data_files"].items():
-                    data_file = data_dir / filename
-                    data_file.write_text(content, encoding='utf-8')
-                    created_files.append(str(data_file))
+            created_files = await self._write_files(to_write)
 
             return {
-                "operation": "generate_test_data",
+                "operation": "generate_project_artifacts",
                 "status": "completed",
                 "created_files": created_files,
-                "message": f"Generated {len(created_files)} test data files"
+                "security_warnings": security_warnings,
+                "message": f"Generated {len(created_files)} configuration and test data files"
             }
 
         except Exception as e:
-            self.logger.error(f"Failed to generate test data: {str(e)}")
+            self.logger.error(f"Failed to generate project artifacts: {str(e)}")
             raise
 
     async def execute_operation(self, operation: str, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -799,22 +1025,9 @@ class ParserAgent:
 
         self.logger.info(f"Executing operation: {operation}")
 
-        operation_mapping = {
-            "parse_api_specification": self.parse_api_specification,
-            "generate_environment_configs": self.generate_environment_configs,
-            "generate_test_data": self.generate_test_data,
-
-            # Alternative operation names
-            "parse_swagger": self.parse_api_specification,
-            "parse_postman": self.parse_api_specification,
-            "parse_yaml": self.parse_api_specification,
-            "create_test_config": self.generate_environment_configs,
-            "create_test_data": self.generate_test_data,
-            "generate_test_configuration": self.generate_environment_configs
-        }
-
-        if operation in operation_mapping:
-            return await operation_mapping[operation](params)
+        handler = self._operation_mapping.get(operation)
+        if handler is not None:
+            return await handler(params)
         else:
             # Default to API specification parsing
             self.logger.info(f"Unknown operation '{operation}', defaulting to parse_api_specification")
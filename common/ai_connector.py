@@ -4,7 +4,11 @@ AI Connector module for handling different AI providers (Claude, GPT)
 """
 
 import os
+import copy
+import json
+import time
 import asyncio
+import hashlib
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, List
 from enum import Enum
@@ -12,6 +16,11 @@ import anthropic
 import openai
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
 load_dotenv()
 
 
@@ -94,8 +103,6 @@ class AnthropicConnector(AIConnector):
 
         # If no markers found or extraction failed, try JSON parsing
         try:
-            import json
-
             # Find JSON block in response
             start_idx = response_text.find('{')
             end_idx = response_text.rfind('}') + 1
@@ -103,12 +110,14 @@ class AnthropicConnector(AIConnector):
             if start_idx != -1 and end_idx != -1:
                 json_str = response_text[start_idx:end_idx]
 
-                # Try to parse JSON
+                # Try to parse JSON; orjson parses multi-KB structured
+                # responses several times faster than the stdlib
                 try:
-                    result = json.loads(json_str)
-                    return result
+                    if orjson is not None:
+                        return orjson.loads(json_str)
+                    return json.loads(json_str)
 
-                except json.JSONDecodeError as e:
+                except ValueError:
                     # Return raw response
                     return {"response": response_text}
             else:
@@ -120,6 +129,66 @@ class AnthropicConnector(AIConnector):
             return {"response": response_text}
 
 
+class CachingAIConnector(AIConnector):
+    """Wraps another connector with an in-memory response cache.
+
+    LLM round-trips dominate orchestration wall-clock time and repeated runs
+    issue near-identical prompts, so responses are cached keyed by a hash of
+    the whitespace-normalized prompt and system message. Entries expire after
+    a TTL and the oldest entry is evicted once the cache is full.
+    """
+
+    def __init__(self, connector: AIConnector, max_entries: int = 128, ttl_seconds: float = 3600.0):
+        self.connector = connector
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._cache: Dict[str, tuple] = {}
+
+    @staticmethod
+    def _cache_key(kind: str, prompt: str, system_message: str = None) -> str:
+        normalized = ' '.join(prompt.split()).lower()
+        if system_message:
+            normalized = ' '.join(system_message.split()).lower() + '\x00' + normalized
+        return hashlib.sha256((kind + '\x00' + normalized).encode('utf-8')).hexdigest()
+
+    def _get(self, key: str):
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        created_at, value = entry
+        if time.monotonic() - created_at > self.ttl_seconds:
+            del self._cache[key]
+            return None
+        return value
+
+    def _put(self, key: str, value):
+        if len(self._cache) >= self.max_entries:
+            oldest_key = min(self._cache, key=lambda k: self._cache[k][0])
+            del self._cache[oldest_key]
+        self._cache[key] = (time.monotonic(), value)
+
+    async def generate_response(self, prompt: str, system_message: str = None) -> str:
+        key = self._cache_key("text", prompt, system_message)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+
+        response = await self.connector.generate_response(prompt, system_message)
+        self._put(key, response)
+        return response
+
+    async def generate_structured_response(self, prompt: str, system_message: str = None) -> Dict[str, Any]:
+        key = self._cache_key("structured", prompt, system_message)
+        cached = self._get(key)
+        if cached is not None:
+            # Copy so callers mutating the result don't poison the cache
+            return copy.deepcopy(cached)
+
+        response = await self.connector.generate_structured_response(prompt, system_message)
+        self._put(key, response)
+        return copy.deepcopy(response)
+
+
 class OpenAIConnector(AIConnector):
     """OpenAI GPT connector (stub for future implementation)"""
 
@@ -152,12 +221,16 @@ class AIConnectorFactory:
             provider = AIProvider(provider_str)
 
         if provider == AIProvider.ANTHROPIC:
-            return AnthropicConnector()
+            connector = AnthropicConnector()
         elif provider == AIProvider.OPENAI:
-            return OpenAIConnector()
+            connector = OpenAIConnector()
         else:
             raise ValueError(f"Unsupported AI provider: {provider}")
 
+        if os.getenv("DISABLE_AI_RESPONSE_CACHE", "").lower() in ("1", "true", "yes"):
+            return connector
+        return CachingAIConnector(connector)
+
 
 # Convenience function for quick access
 async def get_ai_response(prompt: str, system_message: str = None, provider: AIProvider = None) -> str: